@@ -1,6 +1,6 @@
 """t87s - Declarative cache invalidation for Python."""
 
-from contextlib import suppress
+from typing import TYPE_CHECKING, Any
 
 # Adapters (async only)
 from t87s.adapters import (
@@ -30,15 +30,28 @@ from t87s.types import (
     Tag,
 )
 
-# Optional adapter imports - only available when dependencies are installed
-with suppress(ImportError):
-    from t87s.adapters import AsyncRedisAdapter
+# Optional adapters - resolved lazily by t87s.adapters on first access
+if TYPE_CHECKING:
+    from t87s.adapters import (
+        AsyncCloudAdapter,
+        AsyncRedisAdapter,
+        AsyncUpstashAdapter,
+    )
 
-with suppress(ImportError):
-    from t87s.adapters import AsyncUpstashAdapter
+_OPTIONAL_ADAPTERS = frozenset(
+    {"AsyncCloudAdapter", "AsyncRedisAdapter", "AsyncUpstashAdapter"}
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _OPTIONAL_ADAPTERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from t87s import adapters
+
+    adapter = getattr(adapters, name)
+    globals()[name] = adapter
+    return adapter
 
-with suppress(ImportError):
-    from t87s.adapters import AsyncCloudAdapter
 
 __version__ = "0.1.0"
 
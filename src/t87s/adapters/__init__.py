@@ -1,6 +1,7 @@
 """Storage adapters for t87s cache library (async only)."""
 
-from contextlib import suppress
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from t87s.adapters.base import (
     AsyncStorageAdapter,
@@ -8,15 +9,28 @@ from t87s.adapters.base import (
 )
 from t87s.adapters.memory import AsyncMemoryAdapter
 
-# Optional adapters - only available when dependencies are installed
-with suppress(ImportError):
+if TYPE_CHECKING:
+    from t87s.adapters.cloud import AsyncCloudAdapter
     from t87s.adapters.redis import AsyncRedisAdapter
-
-with suppress(ImportError):
     from t87s.adapters.upstash import AsyncUpstashAdapter
 
-with suppress(ImportError):
-    from t87s.adapters.cloud import AsyncCloudAdapter
+# Optional adapters are imported on first access (PEP 562), so importing
+# t87s doesn't load backends - or their dependencies - that go unused.
+_OPTIONAL_ADAPTERS: dict[str, str] = {
+    "AsyncCloudAdapter": "t87s.adapters.cloud",
+    "AsyncRedisAdapter": "t87s.adapters.redis",
+    "AsyncUpstashAdapter": "t87s.adapters.upstash",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _OPTIONAL_ADAPTERS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    adapter = getattr(importlib.import_module(module), name)
+    globals()[name] = adapter
+    return adapter
+
 
 __all__ = [
     "AsyncCloudAdapter",
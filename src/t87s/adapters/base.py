@@ -7,7 +7,20 @@ from t87s.types import CacheEntry, Tag
 
 @runtime_checkable
 class AsyncStorageAdapter(Protocol):
-    """Async storage adapter interface."""
+    """Async storage adapter interface.
+
+    Adapters whose backend already drops entries with invalidated tags
+    during get() can set a class attribute ``checks_tags_on_get = True``
+    so that callers skip their own client-side tag checks.
+
+    Adapters may also define batched tag methods to handle several tags in
+    one round trip:
+
+        async def get_tag_invalidation_times(tags) -> list[int | None]
+        async def set_tag_invalidation_times(tags, timestamp) -> None
+
+    Both are optional: callers fall back to one single-tag call per tag.
+    """
 
     async def get(self, key: str) -> CacheEntry[object] | None:
         """Get a cache entry by key."""
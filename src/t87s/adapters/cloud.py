@@ -2,76 +2,291 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import time
-from typing import Any, cast
+from collections.abc import Awaitable, Callable, Sequence
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, Literal
+
+import msgspec
 
 from t87s.types import CacheEntry, Tag
 
+if TYPE_CHECKING:
+    import httpx
+
+WireFormat = Literal["msgpack", "json"]
+
+_CONTENT_TYPES: dict[str, str] = {
+    "msgpack": "application/msgpack",
+    "json": "application/json",
+}
+
+
+class _WireEntry(msgspec.Struct, rename="camel"):
+    """Cache entry as sent over the wire (camelCase keys)."""
+
+    value: Any
+    tags: list[Tag]
+    created_at: int
+    expires_at: int
+    grace_until: int | None = None
+
+
+class _SetRequest(msgspec.Struct):
+    """Request body of /v1/cache/set."""
+
+    key: str
+    entry: _WireEntry
+
+
+class _GetResponse(msgspec.Struct):
+    """Response body of /v1/cache/get."""
+
+    entry: _WireEntry | None = None
+
+
+_MSGPACK_ENC = msgspec.msgpack.Encoder()
+_JSON_ENC = msgspec.json.Encoder()
+
+# (msgpack, json) decoder pairs, picked per response Content-Type
+_DICT_DECODERS = (
+    msgspec.msgpack.Decoder(dict[str, Any]),
+    msgspec.json.Decoder(dict[str, Any]),
+)
+_GET_DECODERS = (
+    msgspec.msgpack.Decoder(_GetResponse),
+    msgspec.json.Decoder(_GetResponse),
+)
+
+
+def _decode_body(
+    response: httpx.Response,
+    decoders: tuple[Any, Any] = _DICT_DECODERS,
+) -> Any:
+    """Decode a response body according to its Content-Type."""
+    msgpack_decoder, json_decoder = decoders
+    content_type = response.headers.get("content-type", "")
+    if content_type.startswith(_CONTENT_TYPES["msgpack"]):
+        return msgpack_decoder.decode(response.content)
+    return json_decoder.decode(response.content)
+
+
+def _request_headers(api_key: str, wire_format: WireFormat) -> dict[str, str]:
+    """Headers every cloud API request carries."""
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": _CONTENT_TYPES[wire_format],
+        "Accept": "application/msgpack, application/json",
+    }
+
+
+def _create_client(
+    api_key: str, base_url: str, wire_format: WireFormat
+) -> httpx.AsyncClient:
+    """Create an HTTP client configured for the cloud API."""
+    import httpx
+
+    # Configured on the client rather than through a custom transport, which
+    # would turn off httpx's HTTP(S)_PROXY environment support
+    return httpx.AsyncClient(
+        base_url=base_url,
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_keepalive_connections=64,
+            max_connections=128,
+            keepalive_expiry=60.0,
+        ),
+        headers=_request_headers(api_key, wire_format),
+        timeout=30.0,
+    )
+
+
+class _InvalidationBatcher:
+    """Coalesce concurrent tag invalidations into batched requests.
+
+    The first submitter schedules a flush; every tag submitted before the
+    flush runs (plus anything arriving while a batch is in flight) is sent
+    together, deduplicated, in chunks of at most ``max_batch`` tags. With
+    ``flush_ms=0`` a lone invalidation goes out on the next loop iteration.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[list[Tag]], Awaitable[object]],
+        *,
+        max_batch: int,
+        flush_ms: float,
+    ) -> None:
+        self._send = send
+        self._max_batch = max_batch
+        self._flush_delay = flush_ms / 1000
+        self._pending: list[tuple[Tag, asyncio.Future[None]]] = []
+        self._task: asyncio.Task[None] | None = None
+
+    async def submit(self, tag: Tag) -> None:
+        """Queue a tag and wait until its batch has been sent."""
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._pending.append((tag, future))
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush())
+        await future
+
+    async def _flush(self) -> None:
+        batch: list[tuple[Tag, asyncio.Future[None]]] = []
+        try:
+            if self._flush_delay > 0:
+                await asyncio.sleep(self._flush_delay)
+            while self._pending:
+                batch = self._pending[: self._max_batch]
+                del self._pending[: self._max_batch]
+                tags = list(dict.fromkeys(tag for tag, _ in batch))
+                try:
+                    await self._send(tags)
+                except Exception as e:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_result(None)
+        finally:
+            self._task = None
+            # Only reached with unresolved futures if the flush itself was
+            # cancelled, possibly mid-send
+            for _, future in (*batch, *self._pending):
+                if not future.done():
+                    future.cancel()
+            self._pending.clear()
+
+    async def aclose(self) -> None:
+        """Cancel any scheduled or in-flight flush and wait for it to stop."""
+        task = self._task
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        # A flush cancelled before it started never reached its own cleanup
+        self._task = None
+        for _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+
 
 class AsyncCloudAdapter:
-    """Async Cloud storage adapter with staleness verification support."""
+    """Async Cloud storage adapter with staleness verification support.
+
+    Request bodies are encoded as MessagePack by default; pass
+    ``wire_format="json"`` for services that only accept JSON. Responses
+    are decoded according to their Content-Type, so either format is
+    accepted back. With MessagePack, ``bytes`` values are sent as native
+    binary rather than base64 text, so they round-trip as ``bytes``.
+
+    Requests share a keep-alive connection pool and are multiplexed over
+    HTTP/2 when the ``h2`` package is available (``t87s[cloud]`` installs
+    it).
+
+    Concurrent tag invalidations are coalesced into a single
+    ``/v1/invalidate`` request of up to ``max_batch`` tags. ``flush_ms``
+    optionally delays each flush to gather larger batches.
+
+    Pass ``client`` to use your own ``httpx.AsyncClient``, e.g. to share
+    one connection pool between adapters or to configure proxies and TLS.
+    The adapter sends its own URL and headers on each request, and
+    :meth:`disconnect` leaves a passed-in client open for its owner to
+    close.
+    """
+
+    # The service compares tag invalidation times itself in /v1/cache/get
+    checks_tags_on_get = True
 
     def __init__(
         self,
         api_key: str,
         *,
         base_url: str = "https://api.t87s.dev",
+        wire_format: WireFormat = "msgpack",
+        max_batch: int = 100,
+        flush_ms: float = 0,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
-        import httpx
+        if wire_format not in _CONTENT_TYPES:
+            raise ValueError(f"Invalid wire_format: {wire_format!r}")
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
 
-        self._client = httpx.AsyncClient(
-            base_url=base_url,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            timeout=30.0,
+        self._encode = (
+            _MSGPACK_ENC.encode if wire_format == "msgpack" else _JSON_ENC.encode
+        )
+        self._owns_client = client is None
+        if client is None:
+            self._client = _create_client(api_key, base_url, wire_format)
+            self._url_prefix = ""
+            self._headers: dict[str, str] | None = None
+        else:
+            # A caller's client has its own base URL and headers, so ours
+            # go on each request instead
+            self._client = client
+            self._url_prefix = base_url.rstrip("/")
+            self._headers = _request_headers(api_key, wire_format)
+        self._invalidations = _InvalidationBatcher(
+            self._invalidate, max_batch=max_batch, flush_ms=flush_ms
         )
 
-    async def _request(self, endpoint: str, body: dict[str, Any]) -> dict[str, Any]:
-        """Make a POST request to the cloud API."""
-        response = await self._client.post(endpoint, json=body)
+    async def _post(self, endpoint: str, body: Any) -> httpx.Response:
+        """Make a POST request to the cloud API, raising on failure.
+
+        The body is only decoded on failure, to extract the error message;
+        callers that need the response data decode it themselves.
+        """
+        response = await self._client.post(
+            self._url_prefix + endpoint,
+            content=self._encode(body),
+            headers=self._headers,
+        )
         if not response.is_success:
             try:
-                error = response.json().get("error", "Request failed")
+                error = _decode_body(response).get("error", "Request failed")
             except Exception:
                 error = f"HTTP {response.status_code}"
             raise RuntimeError(error)
-        return cast(dict[str, Any], response.json())
+        return response
 
     async def get(self, key: str) -> CacheEntry[object] | None:
         """Get a cache entry by key."""
-        data = await self._request("/v1/cache/get", {"key": key})
-        entry = data.get("entry")
+        response = await self._post("/v1/cache/get", {"key": key})
+        entry = _decode_body(response, _GET_DECODERS).entry
         if entry is None:
             return None
         return CacheEntry(
-            value=entry["value"],
-            tags=[Tag(tuple(tag)) for tag in entry["tags"]],
-            created_at=entry["createdAt"],
-            expires_at=entry["expiresAt"],
-            grace_until=entry.get("graceUntil"),
+            value=entry.value,
+            tags=entry.tags,
+            created_at=entry.created_at,
+            expires_at=entry.expires_at,
+            grace_until=entry.grace_until,
         )
 
     async def set(self, key: str, entry: CacheEntry[object]) -> None:
         """Store a cache entry."""
-        await self._request(
+        await self._post(
             "/v1/cache/set",
-            {
-                "key": key,
-                "entry": {
-                    "value": entry.value,
-                    "tags": [list(tag) for tag in entry.tags],
-                    "createdAt": entry.created_at,
-                    "expiresAt": entry.expires_at,
-                    "graceUntil": entry.grace_until,
-                },
-            },
+            _SetRequest(
+                key,
+                _WireEntry(
+                    entry.value,
+                    entry.tags,
+                    entry.created_at,
+                    entry.expires_at,
+                    entry.grace_until,
+                ),
+            ),
         )
 
     async def delete(self, key: str) -> None:
         """Delete a cache entry."""
-        await self._request("/v1/cache/delete", {"key": key})
+        await self._post("/v1/cache/delete", {"key": key})
 
     async def get_tag_invalidation_time(self, tag: Tag) -> int | None:
         """Get the invalidation timestamp for a tag.
@@ -82,18 +297,36 @@ class AsyncCloudAdapter:
         # For now, return None. Could add a /v1/tag/get endpoint later.
         return None
 
+    async def get_tag_invalidation_times(self, tags: Sequence[Tag]) -> list[int | None]:
+        """Get invalidation timestamps for several tags (checked server-side)."""
+        return [None] * len(tags)
+
     async def set_tag_invalidation_time(self, tag: Tag, timestamp: int) -> None:
         """Set the invalidation timestamp for a tag."""
-        # Invalidation is done via /v1/invalidate endpoint
-        await self._request("/v1/invalidate", {"tags": [list(tag)], "exact": True})
+        # The service stamps invalidations itself, so concurrent calls can
+        # share one /v1/invalidate request.
+        await self._invalidations.submit(tag)
+
+    async def set_tag_invalidation_times(
+        self, tags: Sequence[Tag], timestamp: int
+    ) -> None:
+        """Set the invalidation timestamp for several tags."""
+        # Submitted together, so they go out in the same batch
+        await asyncio.gather(*(self._invalidations.submit(tag) for tag in tags))
+
+    async def _invalidate(self, tags: list[Tag]) -> None:
+        """Invalidate a batch of tags via the /v1/invalidate endpoint."""
+        await self._post("/v1/invalidate", {"tags": tags, "exact": True})
 
     async def clear(self) -> None:
         """Clear all cached entries."""
-        await self._request("/v1/clear", {})
+        await self._post("/v1/clear", {})
 
     async def disconnect(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client, unless it was passed in."""
+        await self._invalidations.aclose()
+        if self._owns_client:
+            await self._client.aclose()
 
     async def report_verification(
         self,
@@ -103,7 +336,7 @@ class AsyncCloudAdapter:
         fresh_hash: str,
     ) -> None:
         """Report verification result to the cloud service."""
-        await self._request(
+        await self._post(
             "/v1/verify",
             {
                 "key": key,
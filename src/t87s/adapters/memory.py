@@ -1,63 +1,99 @@
 """In-memory storage adapter (async only)."""
 
-import asyncio
 from collections import OrderedDict
+from collections.abc import Sequence
+from functools import lru_cache
 
 from t87s.types import CacheEntry, Tag
 
 
+@lru_cache(maxsize=4096)
 def _serialize_tag(tag: Tag) -> str:
     """Serialize a tag tuple to a string key."""
-    return ":".join(str(part) for part in tag)
+    return ":".join(map(str, tag))
 
 
 class AsyncMemoryAdapter:
-    """Async in-memory storage adapter with optional LRU eviction."""
+    """Async in-memory storage adapter with optional LRU eviction.
+
+    Eviction uses the second-chance (CLOCK) approximation of LRU: a hit
+    only marks the key as referenced, and a referenced key reaching the
+    eviction end is moved back once instead of being dropped. Without
+    ``max_items`` no recency is tracked at all.
+
+    Intended for use from a single event loop. No method awaits between
+    reading and mutating its dicts, so operations cannot interleave and
+    no lock is needed.
+    """
 
     def __init__(self, max_items: int | None = None) -> None:
         self._cache: OrderedDict[str, CacheEntry[object]] = OrderedDict()
+        self._referenced: set[str] = set()
         self._invalidations: dict[str, int] = {}
         self._max_items = max_items
-        self._lock = asyncio.Lock()
 
     async def get(self, key: str) -> CacheEntry[object] | None:
         """Get a cache entry by key."""
-        async with self._lock:
-            entry = self._cache.get(key)
-            if entry:
-                self._cache.move_to_end(key)  # LRU touch
-            return entry
+        entry = self._cache.get(key)
+        if entry is not None and self._max_items:
+            self._referenced.add(key)
+        return entry
 
     async def set(self, key: str, entry: CacheEntry[object]) -> None:
         """Store a cache entry."""
-        async with self._lock:
+        if not self._max_items:
+            self._cache[key] = entry
+            return
+        if key in self._cache:
+            self._referenced.add(key)
+        else:
+            # Make room first so the newcomer isn't the first unreferenced
+            # entry the eviction scan finds.
+            while len(self._cache) >= self._max_items:
+                self._evict()
+        self._cache[key] = entry
+
+    def _evict(self) -> None:
+        """Evict the oldest entry that hasn't been referenced since."""
+        while True:
+            key, entry = self._cache.popitem(last=False)
+            if key not in self._referenced:
+                return
+            # Second chance: clear the bit and requeue at the young end
+            self._referenced.discard(key)
             self._cache[key] = entry
-            self._cache.move_to_end(key)
-            if self._max_items and len(self._cache) > self._max_items:
-                self._cache.popitem(last=False)
 
     async def delete(self, key: str) -> None:
         """Delete a cache entry."""
-        async with self._lock:
-            self._cache.pop(key, None)
+        self._cache.pop(key, None)
+        self._referenced.discard(key)
 
     async def get_tag_invalidation_time(self, tag: Tag) -> int | None:
         """Get the invalidation timestamp for a tag."""
-        key = _serialize_tag(tag)
-        async with self._lock:
-            return self._invalidations.get(key)
+        return self._invalidations.get(_serialize_tag(tag))
+
+    async def get_tag_invalidation_times(self, tags: Sequence[Tag]) -> list[int | None]:
+        """Get invalidation timestamps for several tags, in order."""
+        invalidations = self._invalidations
+        return [invalidations.get(_serialize_tag(tag)) for tag in tags]
 
     async def set_tag_invalidation_time(self, tag: Tag, timestamp: int) -> None:
         """Set the invalidation timestamp for a tag."""
-        key = _serialize_tag(tag)
-        async with self._lock:
-            self._invalidations[key] = timestamp
+        self._invalidations[_serialize_tag(tag)] = timestamp
+
+    async def set_tag_invalidation_times(
+        self, tags: Sequence[Tag], timestamp: int
+    ) -> None:
+        """Set the same invalidation timestamp for several tags."""
+        invalidations = self._invalidations
+        for tag in tags:
+            invalidations[_serialize_tag(tag)] = timestamp
 
     async def clear(self) -> None:
         """Clear all cached entries."""
-        async with self._lock:
-            self._cache.clear()
-            self._invalidations.clear()
+        self._cache.clear()
+        self._referenced.clear()
+        self._invalidations.clear()
 
     async def disconnect(self) -> None:
         """Disconnect from the storage backend (no-op for memory)."""
@@ -3,45 +3,78 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any
 
+import msgspec
+
 from t87s.types import CacheEntry, Tag
 
 
+class _WireEntry(msgspec.Struct, array_like=True):
+    """Cache entry as stored in Redis (a positional msgpack array)."""
+
+    value: Any
+    tags: list[Tag]
+    created_at: int
+    expires_at: int
+    grace_until: int | None
+
+
+_ENC = msgspec.msgpack.Encoder()
+_DEC = msgspec.msgpack.Decoder(_WireEntry)
+
+
+@lru_cache(maxsize=4096)
 def _serialize_tag(tag: Tag) -> str:
     """Serialize a tag tuple to a string key."""
-    return ":".join(str(part) for part in tag)
-
-
-def _serialize_entry(entry: CacheEntry[object]) -> str:
-    """Serialize a cache entry to JSON."""
-    return json.dumps(
-        {
-            "value": entry.value,
-            "tags": [list(tag) for tag in entry.tags],
-            "created_at": entry.created_at,
-            "expires_at": entry.expires_at,
-            "grace_until": entry.grace_until,
-        }
+    return ":".join(map(str, tag))
+
+
+def _serialize_entry(entry: CacheEntry[object]) -> bytes:
+    """Serialize a cache entry to MessagePack."""
+    return _ENC.encode(
+        _WireEntry(
+            entry.value,
+            entry.tags,
+            entry.created_at,
+            entry.expires_at,
+            entry.grace_until,
+        )
     )
 
 
 def _deserialize_entry(data: bytes | str) -> CacheEntry[object]:
-    """Deserialize JSON to a cache entry."""
-    if isinstance(data, bytes):
-        data = data.decode("utf-8")
-    obj = json.loads(data)
+    """Deserialize MessagePack (or a legacy JSON entry) to a cache entry."""
+    if isinstance(data, str) or data[:1] == b"{":
+        # Written as JSON by earlier versions; msgpack arrays never start
+        # with "{".
+        obj = json.loads(data)
+        return CacheEntry(
+            value=obj["value"],
+            tags=[Tag(tuple(tag)) for tag in obj["tags"]],
+            created_at=obj["created_at"],
+            expires_at=obj["expires_at"],
+            grace_until=obj["grace_until"],
+        )
+    wire = _DEC.decode(data)
     return CacheEntry(
-        value=obj["value"],
-        tags=[Tag(tuple(tag)) for tag in obj["tags"]],
-        created_at=obj["created_at"],
-        expires_at=obj["expires_at"],
-        grace_until=obj["grace_until"],
+        value=wire.value,
+        tags=wire.tags,
+        created_at=wire.created_at,
+        expires_at=wire.expires_at,
+        grace_until=wire.grace_until,
     )
 
 
 class AsyncRedisAdapter:
-    """Async Redis storage adapter."""
+    """Async Redis storage adapter.
+
+    Entries are stored as MessagePack, so the client must return raw
+    bytes (``decode_responses=False``, the redis-py default). A client
+    created with ``decode_responses=True`` is rejected.
+    """
 
     def __init__(
         self,
@@ -49,16 +82,24 @@ class AsyncRedisAdapter:
         *,
         prefix: str = "t87s",
     ) -> None:
+        get_kwargs = getattr(client, "get_connection_kwargs", None)
+        if get_kwargs is not None and get_kwargs().get("decode_responses"):
+            raise ValueError(
+                "AsyncRedisAdapter stores entries as MessagePack bytes; "
+                "create the Redis client with decode_responses=False"
+            )
         self._client = client
         self._prefix = prefix
+        self._cache_prefix = f"{prefix}:cache:"
+        self._tag_prefix = f"{prefix}:tag:"
 
     def _cache_key(self, key: str) -> str:
         """Generate full Redis key for cache entries."""
-        return f"{self._prefix}:cache:{key}"
+        return self._cache_prefix + key
 
     def _tag_key(self, tag: Tag) -> str:
         """Generate full Redis key for tag invalidation times."""
-        return f"{self._prefix}:tag:{_serialize_tag(tag)}"
+        return self._tag_prefix + _serialize_tag(tag)
 
     async def get(self, key: str) -> CacheEntry[object] | None:
         """Get a cache entry by key."""
@@ -88,24 +129,44 @@ class AsyncRedisAdapter:
             return None
         return int(data)
 
+    async def get_tag_invalidation_times(self, tags: Sequence[Tag]) -> list[int | None]:
+        """Get invalidation timestamps for several tags with one MGET."""
+        if not tags:
+            return []
+        values = await self._client.mget([self._tag_key(tag) for tag in tags])
+        return [None if value is None else int(value) for value in values]
+
     async def set_tag_invalidation_time(self, tag: Tag, timestamp: int) -> None:
         """Set the invalidation timestamp for a tag."""
         # Tag invalidation times don't expire - they're used for comparison
         await self._client.set(self._tag_key(tag), str(timestamp))
 
+    async def set_tag_invalidation_times(
+        self, tags: Sequence[Tag], timestamp: int
+    ) -> None:
+        """Set the same invalidation timestamp for several tags with one MSET."""
+        if not tags:
+            return
+        value = str(timestamp)
+        await self._client.mset({self._tag_key(tag): value for tag in tags})
+
     async def clear(self) -> None:
         """Clear all cached entries (but not tag invalidation times)."""
-        # Use SCAN to find and delete all cache keys
-        cursor: int = 0
-        pattern = f"{self._prefix}:cache:*"
-        while True:
-            result = await self._client.scan(cursor, match=pattern, count=100)
-            cursor = result[0]
-            keys = result[1]
-            if keys:
-                await self._client.delete(*keys)
-            if cursor == 0:
-                break
+        # SCAN for cache keys and UNLINK them in pipelined batches, so each
+        # batch costs one round trip, the pipeline buffer stays bounded, and
+        # Redis frees the memory in the background.
+        pattern = self._cache_prefix + "*"
+        batch: list[bytes] = []
+        async with self._client.pipeline(transaction=False) as pipe:
+            async for key in self._client.scan_iter(match=pattern, count=1000):
+                batch.append(key)
+                if len(batch) == 1000:
+                    pipe.unlink(*batch)
+                    await pipe.execute()
+                    batch = []
+            if batch:
+                pipe.unlink(*batch)
+                await pipe.execute()
 
     async def disconnect(self) -> None:
         """Close the Redis connection."""
@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any
 
 from t87s.types import CacheEntry, Tag
 
 
+@lru_cache(maxsize=4096)
 def _serialize_tag(tag: Tag) -> str:
     """Serialize a tag tuple to a string key."""
-    return ":".join(str(part) for part in tag)
+    return ":".join(map(str, tag))
 
 
 def _serialize_entry(entry: CacheEntry[object]) -> str:
@@ -49,14 +52,16 @@ class AsyncUpstashAdapter:
     ) -> None:
         self._client = client
         self._prefix = prefix
+        self._cache_prefix = f"{prefix}:cache:"
+        self._tag_prefix = f"{prefix}:tag:"
 
     def _cache_key(self, key: str) -> str:
         """Generate full Redis key for cache entries."""
-        return f"{self._prefix}:cache:{key}"
+        return self._cache_prefix + key
 
     def _tag_key(self, tag: Tag) -> str:
         """Generate full Redis key for tag invalidation times."""
-        return f"{self._prefix}:tag:{_serialize_tag(tag)}"
+        return self._tag_prefix + _serialize_tag(tag)
 
     async def get(self, key: str) -> CacheEntry[object] | None:
         """Get a cache entry by key."""
@@ -86,15 +91,31 @@ class AsyncUpstashAdapter:
             return None
         return int(str(data))
 
+    async def get_tag_invalidation_times(self, tags: Sequence[Tag]) -> list[int | None]:
+        """Get invalidation timestamps for several tags with one MGET."""
+        if not tags:
+            return []
+        values = await self._client.mget(*[self._tag_key(tag) for tag in tags])
+        return [None if value is None else int(str(value)) for value in values]
+
     async def set_tag_invalidation_time(self, tag: Tag, timestamp: int) -> None:
         """Set the invalidation timestamp for a tag."""
         await self._client.set(self._tag_key(tag), str(timestamp))
 
+    async def set_tag_invalidation_times(
+        self, tags: Sequence[Tag], timestamp: int
+    ) -> None:
+        """Set the same invalidation timestamp for several tags with one MSET."""
+        if not tags:
+            return
+        value = str(timestamp)
+        await self._client.mset({self._tag_key(tag): value for tag in tags})
+
     async def clear(self) -> None:
         """Clear all cached entries (but not tag invalidation times)."""
         # Use SCAN to find and delete all cache keys
         cursor = 0
-        pattern = f"{self._prefix}:cache:*"
+        pattern = self._cache_prefix + "*"
         while True:
             result = await self._client.scan(cursor, match=pattern, count=100)
             cursor = result[0]
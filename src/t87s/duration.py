@@ -1,6 +1,7 @@
 """Duration parsing utilities."""
 
 import re
+from functools import lru_cache
 
 from t87s.types import Duration
 
@@ -18,7 +19,12 @@ def parse_duration(duration: Duration) -> int:
     """Parse duration string to milliseconds. Passthrough if already int."""
     if isinstance(duration, int):
         return duration
+    return _parse_duration_str(duration)
 
+
+@lru_cache(maxsize=128)
+def _parse_duration_str(duration: str) -> int:
+    """Parse a duration string; cached since a program uses only a handful."""
     match = _DURATION_PATTERN.match(duration)
     if not match:
         raise ValueError(f"Invalid duration: {duration!r}")
@@ -14,8 +14,12 @@ import hashlib
 import json
 import random
 import time
-from collections.abc import Awaitable, Callable
+from collections import deque
+from collections.abc import Awaitable, Callable, Coroutine, Sequence
+from contextlib import suppress
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import chain
 from typing import Any, TypeVar, cast
 
 from t87s.adapters.base import AsyncStorageAdapter, AsyncVerifiableAdapter
@@ -24,6 +28,76 @@ from t87s.types import CacheEntry, Duration, EntriesResult, Tag
 
 T = TypeVar("T")
 
+_random = random.random
+
+# Verification and SWR refreshes run on at most this many worker tasks.
+# Workers exit once the queue drains, so nothing outlives its jobs. Jobs
+# beyond the queue bound are dropped: both are best-effort and a later hit
+# will schedule them again.
+_BACKGROUND_WORKERS = 16
+_BACKGROUND_QUEUE_SIZE = 1024
+
+
+def _now_ms() -> int:
+    """Current Unix time in integer milliseconds."""
+    return time.time_ns() // 1_000_000
+
+
+def _json_dumps_canonical(value: Any) -> bytes:
+    """Encode a value as JSON with sorted keys, stringifying unknown types."""
+    return json.dumps(
+        value, sort_keys=True, default=str, separators=(",", ":")
+    ).encode()
+
+
+_json_canonical: Callable[[Any], bytes] | None = None
+
+
+def _canonical_encoder() -> Callable[[Any], bytes]:
+    """Pick the canonical JSON encoder on first use.
+
+    msgspec (installed with the cloud and redis extras) encodes the same
+    canonical form several times faster. Digests are only compared within
+    one process, so either encoder works. The import is deferred so that
+    ``import t87s`` doesn't load optional dependencies.
+    """
+    global _json_canonical
+    try:
+        import msgspec
+    except ImportError:
+        _json_canonical = _json_dumps_canonical
+    else:
+        _json_canonical = msgspec.json.Encoder(enc_hook=str, order="sorted").encode
+    return _json_canonical
+
+
+def _hash_value(value: Any) -> str:
+    """Short content digest of a value, for comparing cached vs fresh data."""
+    encode = _json_canonical or _canonical_encoder()
+    return hashlib.blake2b(encode(value), digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=8192)
+def _tag_and_parents(tag: Tag) -> tuple[Tag, ...]:
+    """Return a tag followed by each of its parent prefixes."""
+    return (tag, *(Tag(tag[:i]) for i in range(1, len(tag))))
+
+
+async def _get_tag_times_each(
+    adapter: AsyncStorageAdapter, tags: Sequence[Tag]
+) -> list[int | None]:
+    """Look up tags one call each, for adapters without the batched method."""
+    get_time = adapter.get_tag_invalidation_time
+    return list(await asyncio.gather(*(get_time(tag) for tag in tags)))
+
+
+async def _set_tag_times_each(
+    adapter: AsyncStorageAdapter, tags: Sequence[Tag], timestamp: int
+) -> None:
+    """Set tags one call each, for adapters without the batched method."""
+    set_time = adapter.set_tag_invalidation_time
+    await asyncio.gather(*(set_time(tag, timestamp) for tag in tags))
+
 
 @dataclass
 class Primitives:
@@ -35,7 +109,39 @@ class Primitives:
     _default_grace: int | None
     _verify_percent: float
     _in_flight: dict[str, asyncio.Future[Any]] = field(default_factory=dict)
-    _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    _check_tags: bool = field(init=False)
+    _get_tag_times: Callable[[Sequence[Tag]], Awaitable[list[int | None]]] = field(
+        init=False
+    )
+    _set_tag_times: Callable[[Sequence[Tag], int], Awaitable[None]] = field(init=False)
+    _verifier: AsyncVerifiableAdapter | None = field(init=False)
+    _background: deque[Coroutine[Any, Any, None]] = field(
+        default_factory=deque, init=False
+    )
+    _workers: set[asyncio.Task[None]] = field(default_factory=set, init=False)
+    _refreshing: set[str] = field(default_factory=set, init=False)
+
+    def __post_init__(self) -> None:
+        # Adapters that filter invalidated entries server-side make our own
+        # per-tag lookups redundant round trips.
+        self._check_tags = not getattr(self._adapter, "checks_tags_on_get", False)
+        # The batched tag methods are optional; adapters written against
+        # the single-tag protocol get one concurrent call per tag instead.
+        # The fallbacks bind the adapter, not self, so Primitives holds no
+        # reference cycle and is freed as soon as it is dropped.
+        self._get_tag_times = getattr(
+            self._adapter,
+            "get_tag_invalidation_times",
+            partial(_get_tag_times_each, self._adapter),
+        )
+        self._set_tag_times = getattr(
+            self._adapter,
+            "set_tag_invalidation_times",
+            partial(_set_tag_times_each, self._adapter),
+        )
+        self._verifier = (
+            self._adapter if isinstance(self._adapter, AsyncVerifiableAdapter) else None
+        )
 
     async def query(
         self,
@@ -68,27 +174,26 @@ class Primitives:
             entry = await self._adapter.get(full_key)
 
             if entry is not None:
-                stale = await self._is_stale(entry)
-                expired = self._is_expired(entry)
+                now = _now_ms()
 
-                # Fresh and not stale - return immediately
-                if not stale and not expired:
+                # Fresh and not stale - return immediately. Tags are only
+                # looked up for unexpired entries: an expired one is served
+                # from grace or refetched whether or not it is stale.
+                if not self._is_expired(entry, now) and not await self._is_stale(entry):
                     if self._should_verify():
                         # Fire and forget - we don't await verification
-                        asyncio.create_task(  # noqa: RUF006
+                        self._run_in_background(
                             self._run_verification(full_key, entry.value, fn)
                         )
-                    return cast(T, entry.value)
+                    return entry.value  # type: ignore[return-value]
 
                 # Stale/expired but in grace - return stale, refresh bg
-                if self._is_within_grace(entry):
+                if self._is_within_grace(entry, now):
                     # Fire and forget - we don't await background refresh
-                    asyncio.create_task(  # noqa: RUF006
-                        self._refresh_in_background(
-                            full_key, tags, fn, ttl, grace, entry.value, on_refresh
-                        )
+                    self._schedule_refresh(
+                        full_key, tags, fn, ttl, grace, entry.value, on_refresh
                     )
-                    return cast(T, entry.value)
+                    return entry.value  # type: ignore[return-value]
 
             # Cache miss or outside grace - fetch synchronously
             value = await fn()
@@ -127,7 +232,7 @@ class Primitives:
         entry = await self._adapter.get(full_key)
         if entry is None:
             return None
-        if await self._is_stale(entry) or self._is_expired(entry):
+        if self._is_expired(entry, _now_ms()) or await self._is_stale(entry):
             return None
         return entry.value
 
@@ -161,9 +266,7 @@ class Primitives:
         with more specific tags (children).
         """
         _ = exact  # Reserved for future use
-        now = int(time.time() * 1000)
-        for tag in tags:
-            await self._adapter.set_tag_invalidation_time(Tag(tag), now)
+        await self._set_tag_times([Tag(tag) for tag in tags], _now_ms())
 
     async def clear(self) -> None:
         """Clear all cached entries."""
@@ -171,6 +274,7 @@ class Primitives:
 
     async def disconnect(self) -> None:
         """Disconnect from the storage backend."""
+        self._stop_background()
         await self._adapter.disconnect()
 
     # -------------------------------------------------------------------------
@@ -185,7 +289,7 @@ class Primitives:
         ttl: Duration | None,
         grace: Duration | None,
     ) -> None:
-        now = int(time.time() * 1000)
+        now = _now_ms()
         ttl_ms = parse_duration(ttl) if ttl else self._default_ttl
         grace_ms = parse_duration(grace) if grace else self._default_grace
 
@@ -207,7 +311,7 @@ class Primitives:
         grace: Duration | None,
     ) -> CacheEntry[T]:
         """Fetch, store, and return the cache entry."""
-        now = int(time.time() * 1000)
+        now = _now_ms()
         ttl_ms = parse_duration(ttl) if ttl else self._default_ttl
         grace_ms = parse_duration(grace) if grace else self._default_grace
 
@@ -224,38 +328,102 @@ class Primitives:
 
     async def _is_stale(self, entry: CacheEntry[Any]) -> bool:
         """Check if any tag has been invalidated since entry creation."""
-        for tag in entry.tags:
-            # Check exact invalidation
-            inv_time = await self._adapter.get_tag_invalidation_time(tag)
-            if inv_time is not None and inv_time >= entry.created_at:
-                return True
-            # Check prefix invalidations (all parent tags)
-            for i in range(1, len(tag)):
-                parent = Tag(tag[:i])
-                inv_time = await self._adapter.get_tag_invalidation_time(parent)
-                if inv_time is not None and inv_time >= entry.created_at:
-                    return True
-        return False
-
-    def _is_expired(self, entry: CacheEntry[Any]) -> bool:
+        tags = entry.tags
+        if not self._check_tags or not tags:
+            return False
+        # Each tag plus all of its parents, fetched in one adapter call
+        if len(tags) == 1:
+            keys = _tag_and_parents(tags[0])
+        else:
+            keys = tuple(
+                dict.fromkeys(chain.from_iterable(map(_tag_and_parents, tags)))
+            )
+        inv_times = await self._get_tag_times(keys)
+        created_at = entry.created_at
+        return any(t is not None and t >= created_at for t in inv_times)
+
+    def _is_expired(self, entry: CacheEntry[Any], now: int) -> bool:
         """Check if entry has exceeded its TTL."""
-        return time.time() * 1000 > entry.expires_at
+        return now > entry.expires_at
 
-    def _is_within_grace(self, entry: CacheEntry[Any]) -> bool:
+    def _is_within_grace(self, entry: CacheEntry[Any], now: int) -> bool:
         """Check if entry is within its grace period."""
         if entry.grace_until is None:
             return False
-        return time.time() * 1000 <= entry.grace_until
+        return now <= entry.grace_until
 
     def _should_verify(self) -> bool:
         """Determine if we should verify this cache hit."""
-        if not isinstance(self._adapter, AsyncVerifiableAdapter):
+        if self._verifier is None:
             return False
-        if self._verify_percent <= 0:
+        # random() is in [0, 1), so this is never true for percentages <= 0
+        # and always true for percentages >= 1
+        return self._verify_percent > 0 and _random() < self._verify_percent
+
+    def _run_in_background(self, job: Coroutine[Any, Any, None]) -> bool:
+        """Queue a background job, starting a worker if fewer are running
+        than the limit.
+
+        Returns False if the queue was full and the job was dropped.
+        """
+        if len(self._background) >= _BACKGROUND_QUEUE_SIZE:
+            job.close()
             return False
-        if self._verify_percent >= 1:
-            return True
-        return random.random() < self._verify_percent
+        self._background.append(job)
+        if len(self._workers) < _BACKGROUND_WORKERS:
+            worker = asyncio.get_running_loop().create_task(self._background_worker())
+            self._workers.add(worker)
+        return True
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        tags: list[tuple[str, ...]],
+        fn: Callable[[], Awaitable[Any]],
+        ttl: Duration | None,
+        grace: Duration | None,
+        stale_value: Any,
+        on_refresh: Callable[[Any, Any, bool], Awaitable[None] | None] | None,
+    ) -> None:
+        """Queue a background refresh unless one is already pending for key."""
+        if key in self._refreshing:
+            return
+        if self._run_in_background(
+            self._refresh_in_background(
+                key, tags, fn, ttl, grace, stale_value, on_refresh
+            )
+        ):
+            self._refreshing.add(key)
+
+    async def _background_worker(self) -> None:
+        """Run queued background jobs, exiting once the queue is empty.
+
+        A worker never waits for new work, so a cache dropped without
+        disconnect() leaves no idle tasks behind.
+        """
+        queue = self._background
+        try:
+            while queue:
+                job = queue.popleft()
+                # Jobs swallow their own errors; this just keeps the worker
+                # alive
+                with suppress(Exception):
+                    await job
+        finally:
+            # Leave the pool in the same step as the final empty check; a
+            # done callback would run a loop iteration later, and a job
+            # queued in between would find the pool full and never start
+            self._workers.discard(asyncio.current_task())
+
+    def _stop_background(self) -> None:
+        """Cancel running workers and discard jobs that have not started."""
+        for worker in list(self._workers):
+            if not worker.get_loop().is_closed():
+                worker.cancel()
+        self._workers.clear()
+        self._refreshing.clear()
+        while self._background:
+            self._background.popleft().close()
 
     async def _run_verification(
         self,
@@ -266,15 +434,11 @@ class Primitives:
         """Run verification in background."""
         try:
             fresh_value = await fn()
-            cached_hash = hashlib.sha256(
-                json.dumps(cached_value, sort_keys=True, default=str).encode()
-            ).hexdigest()[:16]
-            fresh_hash = hashlib.sha256(
-                json.dumps(fresh_value, sort_keys=True, default=str).encode()
-            ).hexdigest()[:16]
+            cached_hash = _hash_value(cached_value)
+            fresh_hash = _hash_value(fresh_value)
             is_stale = cached_hash != fresh_hash
-            if isinstance(self._adapter, AsyncVerifiableAdapter):
-                await self._adapter.report_verification(
+            if self._verifier is not None:
+                await self._verifier.report_verification(
                     key, is_stale, cached_hash, fresh_hash
                 )
         except Exception:
@@ -296,17 +460,13 @@ class Primitives:
             await self._store(key, fresh_value, tags, ttl, grace)
 
             # Compute staleness
-            cached_hash = hashlib.sha256(
-                json.dumps(stale_value, sort_keys=True, default=str).encode()
-            ).hexdigest()[:16]
-            fresh_hash = hashlib.sha256(
-                json.dumps(fresh_value, sort_keys=True, default=str).encode()
-            ).hexdigest()[:16]
+            cached_hash = _hash_value(stale_value)
+            fresh_hash = _hash_value(fresh_value)
             changed = cached_hash != fresh_hash
 
             # Report verification (SWR is 100% verification opportunity)
-            if isinstance(self._adapter, AsyncVerifiableAdapter):
-                await self._adapter.report_verification(
+            if self._verifier is not None:
+                await self._verifier.report_verification(
                     key, changed, cached_hash, fresh_hash
                 )
 
@@ -320,21 +480,20 @@ class Primitives:
                     pass  # Swallow callback errors
         except Exception:
             pass  # Silently fail background refresh
+        finally:
+            self._refreshing.discard(key)
 
     async def _coalesce(self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
         """Coalesce concurrent requests for same key (stampede protection)."""
-        # Check if there's already an in-flight request
-        async with self._lock:
-            if key in self._in_flight:
-                existing_future = self._in_flight[key]
-                # Wait for existing request outside the lock
-                result: T = await existing_future
-                return result
-
-            # We're the first - create a future and register it
-            loop = asyncio.get_event_loop()
-            new_future: asyncio.Future[T] = loop.create_future()
-            self._in_flight[key] = new_future
+        # No lock needed: nothing awaits between the lookup and the insert,
+        # so they happen atomically with respect to other tasks on the loop.
+        existing_future = self._in_flight.get(key)
+        if existing_future is not None:
+            result: T = await existing_future
+            return result
+
+        new_future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = new_future
 
         try:
             result = await fetch()
@@ -344,8 +503,7 @@ class Primitives:
             new_future.set_exception(e)
             raise
         finally:
-            async with self._lock:
-                del self._in_flight[key]
+            del self._in_flight[key]
 
     async def _get_or_fetch_with_entries(
         self,
@@ -357,27 +515,24 @@ class Primitives:
         on_refresh: Callable[[T, T, bool], None | Awaitable[None]] | None,
     ) -> EntriesResult[T]:
         """Fetch with caching and return before/after entries."""
-        raw_entry = await self._adapter.get(key)
-        entry = cast(CacheEntry[T] | None, raw_entry)
+        entry: CacheEntry[T] | None = await self._adapter.get(key)  # type: ignore[assignment]
 
         if entry is not None:
-            stale = await self._is_stale(entry)
-            expired = self._is_expired(entry)
+            now = _now_ms()
 
-            # Fresh and not stale - return immediately
-            if not stale and not expired:
+            # Fresh and not stale - return immediately (tags are only
+            # looked up for unexpired entries, as in query())
+            if not self._is_expired(entry, now) and not await self._is_stale(entry):
                 if self._should_verify():
-                    asyncio.create_task(  # noqa: RUF006
+                    self._run_in_background(
                         self._run_verification(key, entry.value, fn)
                     )
                 return EntriesResult(before=entry, after=entry)
 
             # Stale/expired but in grace - return stale, refresh bg
-            if self._is_within_grace(entry):
-                asyncio.create_task(  # noqa: RUF006
-                    self._refresh_in_background(
-                        key, tags, fn, ttl, grace, entry.value, on_refresh
-                    )
+            if self._is_within_grace(entry, now):
+                self._schedule_refresh(
+                    key, tags, fn, ttl, grace, entry.value, on_refresh
                 )
                 return EntriesResult(before=entry, after=entry)
 
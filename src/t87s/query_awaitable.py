@@ -13,6 +13,8 @@ from t87s.types import EntriesResult
 
 T = TypeVar("T")
 
+_MISSING: Any = object()
+
 
 class QueryAwaitable(Generic[T]):
     """An awaitable that returns T, with an .entries property for cache metadata.
@@ -20,9 +22,13 @@ class QueryAwaitable(Generic[T]):
     Usage:
         result = await query_awaitable           # T
         entry = await query_awaitable.entries    # EntriesResult[T]
+
+    Results are memoized: awaiting again returns the same value, and once
+    .entries has been awaited the value is taken from its ``after`` entry
+    without another cache lookup.
     """
 
-    __slots__ = ("_entries_fn", "_value_fn")
+    __slots__ = ("_entries", "_entries_fn", "_value", "_value_fn")
 
     def __init__(
         self,
@@ -31,14 +37,26 @@ class QueryAwaitable(Generic[T]):
     ) -> None:
         self._value_fn = value_fn
         self._entries_fn = entries_fn
+        self._value: T = _MISSING
+        self._entries: EntriesResult[T] | None = None
 
     def __await__(self) -> Generator[Any, None, T]:
-        return self._value_fn().__await__()
+        if self._value is _MISSING:
+            if self._entries is not None:
+                self._value = self._entries.after.value
+            else:
+                self._value = yield from self._value_fn().__await__()
+        return self._value
 
     @property
     def entries(self) -> Awaitable[EntriesResult[T]]:
         """Access cache metadata (before/after entries)."""
-        return self._entries_fn()
+        return self._get_entries()
+
+    async def _get_entries(self) -> EntriesResult[T]:
+        if self._entries is None:
+            self._entries = await self._entries_fn()
+        return self._entries
 
 
 __all__ = ["QueryAwaitable"]
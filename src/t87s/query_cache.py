@@ -6,12 +6,16 @@ Provides:
 - .t property: Schema instance for runtime tag construction
 - .primitives: Escape hatch to raw operations
 - .invalidate(): Accept TypedTags for invalidation
+- .batch_invalidation(): Send several invalidations as one batch
 """
 
 from __future__ import annotations
 
 import inspect
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import partial
 from typing import (
     Any,
     Generic,
@@ -25,7 +29,7 @@ from t87s.primitives import Primitives, create_primitives
 from t87s.query_awaitable import QueryAwaitable
 from t87s.schema import StaticTagSpec, TagSchema, TagSpec, WildNode, WildTagSpec
 from t87s.typed_tag import TypedTag
-from t87s.types import Duration, EntriesResult
+from t87s.types import Duration
 
 SchemaT = TypeVar("SchemaT", bound=TagSchema)
 
@@ -43,6 +47,24 @@ def _to_tag_spec(spec: CacheableSpec) -> TagSpec:
         raise TypeError(f"Expected TagSpec, got {type(spec)}")
 
 
+def _param_count(fn: Any) -> int:
+    """Count a function's parameters, excluding self.
+
+    Reads the code object directly; falls back to inspect.signature() for
+    callables without one and for wrappers that expose ``__wrapped__``.
+    """
+    code = getattr(fn, "__code__", None)
+    if code is None or hasattr(fn, "__wrapped__"):
+        return len([p for p in inspect.signature(fn).parameters if p != "self"])
+    total = (
+        code.co_argcount
+        + code.co_kwonlyargcount
+        + bool(code.co_flags & inspect.CO_VARARGS)
+        + bool(code.co_flags & inspect.CO_VARKEYWORDS)
+    )
+    return len([name for name in code.co_varnames[:total] if name != "self"])
+
+
 class QueryDescriptor:
     """Descriptor that wraps cached methods."""
 
@@ -54,12 +76,13 @@ class QueryDescriptor:
     ) -> None:
         self._fn = fn
         self._tag_specs = tuple(_to_tag_spec(s) for s in specs)
+        self._tag_builders = tuple(spec.build_path for spec in self._tag_specs)
         self._name = fn.__name__
+        self._key_prefix = f"{self._name}:"
         self._on_refresh = on_refresh
 
         # Validate wild count matches param count
-        sig = inspect.signature(fn)
-        param_count = len([p for p in sig.parameters if p != "self"])
+        param_count = _param_count(fn)
         max_wilds = max((spec.wild_count for spec in self._tag_specs), default=0)
 
         if max_wilds != param_count:
@@ -70,6 +93,7 @@ class QueryDescriptor:
 
     def __set_name__(self, owner: type, name: str) -> None:
         self._name = name
+        self._key_prefix = f"{name}:"
 
     def __get__(self, obj: Any, owner: type) -> Any:
         if obj is None:
@@ -87,36 +111,57 @@ class BoundQuery:
         self._cache = cache
 
     def __call__(self, *args: Any, **kwargs: Any) -> QueryAwaitable[Any]:
-        # Build tags from specs
-        tags = [
-            spec.build_path(args[: spec.wild_count])
-            for spec in self._descriptor._tag_specs
-        ]
+        descriptor = self._descriptor
+        cache = self._cache
 
-        # Build cache key
-        cache_key = f"{self._descriptor._name}:{args}:{kwargs}"
+        # Build tags from specs; build_path only reads the leading args
+        # its wildcards need, so no per-spec slice is taken
+        tags = [build_path(args) for build_path in descriptor._tag_builders]
 
-        # Create fetch function that calls the original method
-        async def fetch() -> Any:
-            return await self._descriptor._fn(self._cache, *args, **kwargs)
+        # Build cache key ("name:args:kwargs"), skipping the repr of the
+        # usual empty kwargs dict
+        cache_key = (
+            descriptor._key_prefix + repr(args) + (f":{kwargs!r}" if kwargs else ":{}")
+        )
 
-        async def fetch_value() -> Any:
-            return await self._cache.primitives.query(
+        # Bind the call up front with partials rather than wrapper coroutines,
+        # so each await runs one coroutine fewer
+        fetch = partial(descriptor._fn, cache, *args, **kwargs)
+        primitives = cache.primitives
+        return QueryAwaitable(
+            partial(
+                primitives.query,
                 key=cache_key,
                 tags=tags,
                 fn=fetch,
-                on_refresh=self._descriptor._on_refresh,
-            )
-
-        async def fetch_entries() -> EntriesResult[Any]:
-            return await self._cache.primitives.query_with_entries(
+                on_refresh=descriptor._on_refresh,
+            ),
+            partial(
+                primitives.query_with_entries,
                 key=cache_key,
                 tags=tags,
                 fn=fetch,
-                on_refresh=self._descriptor._on_refresh,
-            )
+                on_refresh=descriptor._on_refresh,
+            ),
+        )
+
 
-        return QueryAwaitable(fetch_value, fetch_entries)
+class _InvalidationBatch:
+    """Paths buffered by QueryCache.batch_invalidation()."""
+
+    __slots__ = ("closed", "paths")
+
+    def __init__(self) -> None:
+        self.paths: list[tuple[str, ...]] = []
+        self.closed = False
+
+
+# Open invalidation batches, per cache. Tasks started inside a batch inherit
+# this context, so a batch is marked closed when flushed and any later
+# invalidate() from such a task goes straight to the backend.
+_BATCHES: ContextVar[dict[QueryCache[Any], _InvalidationBatch] | None] = ContextVar(
+    "t87s_invalidation_batches", default=None
+)
 
 
 def cached(
@@ -176,8 +221,10 @@ class QueryCache(Generic[SchemaT]):
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
-        # Extract schema type from Generic parameter
-        for base in getattr(cls, "__orig_bases__", ()):
+        # Extract schema type from Generic parameter. Only bases written on
+        # this class are scanned; subclasses of an already-parametrized
+        # cache inherit _schema_type as a plain class attribute
+        for base in cls.__dict__.get("__orig_bases__", ()):
             origin = get_origin(base)
             if origin is QueryCache:
                 args = get_args(base)
@@ -238,7 +285,45 @@ class QueryCache(Generic[SchemaT]):
             else:
                 raise TypeError(f"Expected TypedTag or TagSchema, got {type(tag)}")
 
+        batches = _BATCHES.get()
+        batch = batches.get(self) if batches else None
+        if batch is not None and not batch.closed:
+            batch.paths.extend(paths)
+            return
+
         await self._primitives.invalidate(paths)
 
+    @asynccontextmanager
+    async def batch_invalidation(self) -> AsyncIterator[None]:
+        """Collect invalidate() calls and send them as one batch on exit.
+
+        Usage:
+            async with cache.batch_invalidation():
+                await db.update_user(user_id)
+                await cache.invalidate(cache.t.users(user_id))
+                await cache.invalidate(cache.t.posts_by_user(user_id))
+
+        Duplicate paths are sent once. The batch is flushed even if the
+        block raises, since a partial write may already have happened.
+        Nested batches join the outermost one. A task started inside the
+        block that calls invalidate() after it exits is not batched; its
+        invalidation is sent directly.
+        """
+        batches = _BATCHES.get() or {}
+        outer = batches.get(self)
+        if outer is not None and not outer.closed:
+            yield
+            return
+
+        batch = _InvalidationBatch()
+        token = _BATCHES.set({**batches, self: batch})
+        try:
+            yield
+        finally:
+            _BATCHES.reset(token)
+            batch.closed = True
+            if batch.paths:
+                await self._primitives.invalidate(list(dict.fromkeys(batch.paths)))
+
 
 __all__ = ["QueryCache", "cached"]
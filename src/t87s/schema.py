@@ -26,6 +26,24 @@ from t87s.typed_tag import TypedTag
 
 ChildrenT = TypeVar("ChildrenT", bound="TagSchema")
 
+
+_HINTS_ATTR = "_t87s_type_hints"
+
+
+def _type_hints(cls: type) -> dict[str, Any]:
+    """Resolved type hints of a schema class, computed once per class.
+
+    The hints are stored on the class itself, so they live and die with
+    it. Only successful resolutions are stored, so a forward reference
+    that fails now is retried once its target exists.
+    """
+    hints: dict[str, Any] | None = cls.__dict__.get(_HINTS_ATTR)
+    if hints is None:
+        hints = get_type_hints(cls)
+        setattr(cls, _HINTS_ATTR, hints)
+    return hints
+
+
 # =============================================================================
 # Tag Spec (runtime) - used by @cached decorator
 # =============================================================================
@@ -61,7 +79,7 @@ class TagSpec:
         children_type = None
         if self._children_type is not None:
             try:
-                hints = get_type_hints(self._children_type)
+                hints = _type_hints(self._children_type)
                 hint = hints.get(name)
                 if hint:
                     origin = get_origin(hint)
@@ -91,6 +109,8 @@ class TagSpec:
 
     def build_path(self, args: tuple[Any, ...]) -> tuple[str, ...]:
         """Build a concrete path by filling wildcards with args."""
+        if not self._wild_count:
+            return self._segments
         result: list[str] = []
         arg_idx = 0
         for seg in self._segments:
@@ -178,7 +198,9 @@ class WildNode(Generic[ChildrenT]):
         self, path: tuple[str, ...], children_type: type[ChildrenT] | None
     ) -> None:
         self._path = path
-        self._children_type = children_type
+        # Untyped wild segments build plain TagSchema children; resolving
+        # that here keeps the branch out of __call__
+        self._children_type: type[Any] = children_type or TagSchema
 
     @property
     def path(self) -> tuple[str, ...]:
@@ -186,13 +208,8 @@ class WildNode(Generic[ChildrenT]):
 
     def __call__(self, id: str) -> ChildrenT:
         """Add a value to the path and return children type."""
-        new_path = (*self._path, id)
-        if self._children_type is None:
-            result = TagSchema.__new__(TagSchema)
-            result._path = new_path
-            return result  # type: ignore
-        result = object.__new__(self._children_type)
-        result._path = new_path
+        result: ChildrenT = object.__new__(self._children_type)
+        result._path = (*self._path, id)
         return result
 
 
@@ -226,14 +243,20 @@ else:
 class WildDescriptor(Generic[ChildrenT]):
     """Descriptor for wild tag segments."""
 
-    __slots__ = ("_children_type", "_name")
+    __slots__ = ("_children_type", "_name", "_root", "_spec")
 
     def __init__(self, children_type: type[ChildrenT] | None = None) -> None:
         self._name = ""
         self._children_type = children_type
+        self._spec: WildTagSpec[ChildrenT] = WildTagSpec(TagSpec(("",)))
+        self._root: WildNode[ChildrenT] = WildNode(("",), children_type)
 
     def __set_name__(self, owner: type, name: str) -> None:
         self._name = name
+        # Specs and nodes are immutable, so class access and access from a
+        # root schema each share one
+        self._spec = WildTagSpec(TagSpec((name,), 0, self._children_type))
+        self._root = WildNode((name,), self._children_type)
 
     @overload
     def __get__(self, obj: None, owner: type) -> WildTagSpec[ChildrenT]: ...
@@ -246,23 +269,30 @@ class WildDescriptor(Generic[ChildrenT]):
     ) -> WildTagSpec[ChildrenT] | WildNode[ChildrenT]:
         if obj is None:
             # Class access: return spec for @cached
-            spec = TagSpec((self._name,), 0, self._children_type)
-            return WildTagSpec(spec)
+            return self._spec
         else:
             # Instance access: return node for tag construction
+            if not obj._path:
+                return self._root
             return WildNode((*obj._path, self._name), self._children_type)
 
 
 class StaticDescriptor:
     """Descriptor for static (leaf) tag segments."""
 
-    __slots__ = ("_name",)
+    __slots__ = ("_name", "_root", "_spec")
 
     def __init__(self) -> None:
         self._name = ""
+        self._spec = StaticTagSpec(TagSpec(("",)))
+        self._root = TypedTag(("",))
 
     def __set_name__(self, owner: type, name: str) -> None:
         self._name = name
+        # Specs and tags are immutable, so class access and access from a
+        # root schema each share one
+        self._spec = StaticTagSpec(TagSpec((name,), 0, None))
+        self._root = TypedTag((name,))
 
     @overload
     def __get__(self, obj: None, owner: type) -> StaticTagSpec: ...
@@ -273,10 +303,11 @@ class StaticDescriptor:
     def __get__(self, obj: Any, owner: type) -> StaticTagSpec | TypedTag:
         if obj is None:
             # Class access: return spec
-            spec = TagSpec((self._name,), 0, None)
-            return StaticTagSpec(spec)
+            return self._spec
         else:
             # Instance access: return typed tag
+            if not obj._path:
+                return self._root
             return TypedTag((*obj._path, self._name))
 
 
@@ -285,6 +316,10 @@ class StaticDescriptor:
 # =============================================================================
 
 
+_WILD_NAMES = ("Wild", "_WildMarker", "WildTagSpec")
+_STATIC_NAMES = ("Static", "_StaticMarker", "StaticTagSpec")
+
+
 class TagSchema:
     """Base class for defining tag schemas.
 
@@ -301,33 +336,36 @@ class TagSchema:
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
 
-        try:
-            hints = get_type_hints(cls)
-        except NameError:
-            hints = {}
+        # Only string annotations (quoted, or under PEP 563) need resolving
+        hints: dict[str, Any] | None = None
 
-        raw_annotations = getattr(cls, "__annotations__", {})
-
-        for name in set(hints.keys()) | set(raw_annotations.keys()):
+        for name, raw in getattr(cls, "__annotations__", {}).items():
             if name.startswith("_") or name in cls.__dict__:
                 continue
 
-            hint = hints.get(name)
-            raw = raw_annotations.get(name)
-            raw_str = str(raw) if raw and not isinstance(raw, str) else (raw or "")
-
-            origin = get_origin(hint) if hint else None
-            wild_names = ("Wild", "_WildMarker", "WildTagSpec")
-            is_wild = (
-                origin is not None and getattr(origin, "__name__", "") in wild_names
-            ) or "Wild" in raw_str
-
-            is_static = (
-                hint is Static
-                or raw_str == "Static"
-                or getattr(hint, "__name__", "")
-                in ("Static", "_StaticMarker", "StaticTagSpec")
+            hint = raw
+            if isinstance(raw, str) and raw.rpartition(".")[2].strip() == "Static":
+                # Static takes no type argument, so there is nothing to resolve
+                hint = Static
+            elif isinstance(raw, str):
+                if hints is None:
+                    try:
+                        hints = _type_hints(cls)
+                    except NameError:
+                        hints = {}
+                hint = hints.get(name)
+
+            origin = get_origin(hint) if hint is not None else None
+            is_wild = getattr(origin or hint, "__name__", "") in _WILD_NAMES
+            is_static = not is_wild and (
+                hint is Static or getattr(hint, "__name__", "") in _STATIC_NAMES
             )
+            if hint is None and isinstance(raw, str):
+                # Unresolvable forward reference: go by the outer name,
+                # e.g. "Wild[Later]" or "t87s.Static"
+                outer = raw.partition("[")[0].rpartition(".")[2].strip()
+                is_wild = outer == "Wild"
+                is_static = outer == "Static"
 
             if is_wild:
                 children_type = None
@@ -1,11 +1,15 @@
 """Tests for Cloud adapter using mocked HTTP responses."""
 
+import asyncio
+
 import pytest
 
-# Skip all tests if httpx is not installed
+# Skip all tests if httpx or msgspec are not installed
 pytest.importorskip("httpx")
+pytest.importorskip("msgspec")
 
 import httpx
+import msgspec
 import respx
 
 from t87s import CacheEntry, Tag
@@ -45,8 +49,38 @@ class TestAsyncCloudAdapter:
         result = await async_cloud_adapter.get("key1")
         assert result is not None
         assert result.value == {"id": "456"}
+        assert result.tags == [("post", "456")]
         assert result.grace_until == 4000
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_get_decodes_msgpack_response(
+        self, async_cloud_adapter: AsyncCloudAdapter
+    ) -> None:
+        """Test that msgpack responses are decoded by Content-Type."""
+        respx.post("https://api.test.dev/v1/cache/get").mock(
+            return_value=httpx.Response(
+                200,
+                content=msgspec.msgpack.encode(
+                    {
+                        "entry": {
+                            "value": b"\x00\x01",
+                            "tags": [["post", "456"]],
+                            "createdAt": 2000,
+                            "expiresAt": 3000,
+                            "graceUntil": None,
+                        }
+                    }
+                ),
+                headers={"Content-Type": "application/msgpack"},
+            )
+        )
+
+        result = await async_cloud_adapter.get("key1")
+        assert result is not None
+        assert result.value == b"\x00\x01"
+        assert result.tags == [("post", "456")]
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_get_returns_none_on_missing_entry(
@@ -80,6 +114,74 @@ class TestAsyncCloudAdapter:
         await async_cloud_adapter.set("key1", entry)
 
         assert route.called
+        request = route.calls.last.request
+        assert request.headers["Content-Type"] == "application/msgpack"
+        assert msgspec.msgpack.decode(request.content) == {
+            "key": "key1",
+            "entry": {
+                "value": {"id": "456"},
+                "tags": [["post", "456"]],
+                "createdAt": 2000,
+                "expiresAt": 3000,
+                "graceUntil": None,
+            },
+        }
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_set_sends_bytes_as_msgpack_bin(
+        self, async_cloud_adapter: AsyncCloudAdapter
+    ) -> None:
+        """Test that bytes values are encoded as binary, not base64 text."""
+        route = respx.post("https://api.test.dev/v1/cache/set").mock(
+            return_value=httpx.Response(200, json={"ok": True})
+        )
+        blob = bytes(range(256))
+
+        entry: CacheEntry[object] = CacheEntry(
+            value=blob,
+            tags=[],
+            created_at=2000,
+            expires_at=3000,
+            grace_until=None,
+        )
+        await async_cloud_adapter.set("key1", entry)
+
+        request = route.calls.last.request
+        assert msgspec.msgpack.decode(request.content)["entry"]["value"] == blob
+        assert len(request.content) < len(blob) + 100
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_json_wire_format(self) -> None:
+        """Test that wire_format="json" sends JSON request bodies."""
+        adapter = AsyncCloudAdapter(
+            api_key="test-api-key",
+            base_url="https://api.test.dev",
+            wire_format="json",
+        )
+        route = respx.post("https://api.test.dev/v1/cache/delete").mock(
+            return_value=httpx.Response(200, json={"ok": True})
+        )
+
+        await adapter.delete("key1")
+
+        request = route.calls.last.request
+        assert request.headers["Content-Type"] == "application/json"
+        assert msgspec.json.decode(request.content) == {"key": "key1"}
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_error_response_raises(
+        self, async_cloud_adapter: AsyncCloudAdapter
+    ) -> None:
+        """Test that error responses raise with the server's message."""
+        respx.post("https://api.test.dev/v1/cache/get").mock(
+            return_value=httpx.Response(401, json={"error": "Invalid API key"})
+        )
+
+        with pytest.raises(RuntimeError, match="Invalid API key"):
+            await async_cloud_adapter.get("key1")
 
     @respx.mock
     @pytest.mark.asyncio
@@ -94,6 +196,18 @@ class TestAsyncCloudAdapter:
         await async_cloud_adapter.delete("key1")
         assert route.called
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_delete_accepts_empty_body(
+        self, async_cloud_adapter: AsyncCloudAdapter
+    ) -> None:
+        """Test that a successful delete doesn't need a response body."""
+        respx.post("https://api.test.dev/v1/cache/delete").mock(
+            return_value=httpx.Response(204)
+        )
+
+        await async_cloud_adapter.delete("key1")
+
     @pytest.mark.asyncio
     async def test_get_tag_invalidation_time_returns_none(
         self, async_cloud_adapter: AsyncCloudAdapter
@@ -104,6 +218,16 @@ class TestAsyncCloudAdapter:
         )
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_tag_invalidation_times_returns_nones(
+        self, async_cloud_adapter: AsyncCloudAdapter
+    ) -> None:
+        """Test that batched tag lookups are left to the server too."""
+        result = await async_cloud_adapter.get_tag_invalidation_times(
+            [Tag(("post",)), Tag(("post", "456"))]
+        )
+        assert result == [None, None]
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_set_tag_invalidation_time(
@@ -117,6 +241,106 @@ class TestAsyncCloudAdapter:
         await async_cloud_adapter.set_tag_invalidation_time(Tag(("post", "456")), 4000)
         assert route.called
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_concurrent_invalidations_are_batched(
+        self, async_cloud_adapter: AsyncCloudAdapter
+    ) -> None:
+        """Test that concurrent invalidations share one deduplicated request."""
+        route = respx.post("https://api.test.dev/v1/invalidate").mock(
+            return_value=httpx.Response(200, json={"ok": True})
+        )
+
+        await asyncio.gather(
+            async_cloud_adapter.set_tag_invalidation_time(Tag(("post", "1")), 4000),
+            async_cloud_adapter.set_tag_invalidation_time(Tag(("post", "2")), 4000),
+            async_cloud_adapter.set_tag_invalidation_time(Tag(("post", "1")), 4000),
+        )
+
+        assert route.call_count == 1
+        body = msgspec.msgpack.decode(route.calls.last.request.content)
+        assert body == {"tags": [["post", "1"], ["post", "2"]], "exact": True}
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_set_tag_invalidation_times_sends_one_request(
+        self, async_cloud_adapter: AsyncCloudAdapter
+    ) -> None:
+        """Test that several tags are invalidated in a single request."""
+        route = respx.post("https://api.test.dev/v1/invalidate").mock(
+            return_value=httpx.Response(200, json={"ok": True})
+        )
+
+        await async_cloud_adapter.set_tag_invalidation_times(
+            [Tag(("post", "1")), Tag(("post", "2"))], 4000
+        )
+
+        assert route.call_count == 1
+        body = msgspec.msgpack.decode(route.calls.last.request.content)
+        assert body == {"tags": [["post", "1"], ["post", "2"]], "exact": True}
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_batched_invalidation_error_reaches_all_callers(
+        self, async_cloud_adapter: AsyncCloudAdapter
+    ) -> None:
+        """Test that a failed batch raises in every waiting caller."""
+        respx.post("https://api.test.dev/v1/invalidate").mock(
+            return_value=httpx.Response(500, json={"error": "boom"})
+        )
+
+        results = await asyncio.gather(
+            async_cloud_adapter.set_tag_invalidation_time(Tag(("post", "1")), 4000),
+            async_cloud_adapter.set_tag_invalidation_time(Tag(("post", "2")), 4000),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_releases_in_flight_callers(
+        self, async_cloud_adapter: AsyncCloudAdapter
+    ) -> None:
+        """Test that cancelling a flush mid-send doesn't strand its callers."""
+        sending = asyncio.Event()
+
+        async def hanging_send(tags: list[Tag]) -> None:
+            sending.set()
+            await asyncio.Event().wait()
+
+        batcher = async_cloud_adapter._invalidations
+        batcher._send = hanging_send
+        caller = asyncio.create_task(batcher.submit(Tag(("post", "1"))))
+        await sending.wait()
+
+        await batcher.aclose()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(caller, 1)
+        await async_cloud_adapter.disconnect()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_scheduled_flush(self) -> None:
+        """Test that disconnecting stops a flush before the client closes."""
+        route = respx.post("https://api.test.dev/v1/invalidate").mock(
+            return_value=httpx.Response(200, json={"ok": True})
+        )
+        adapter = AsyncCloudAdapter(
+            api_key="key", base_url="https://api.test.dev", flush_ms=1000
+        )
+        caller = asyncio.create_task(
+            adapter.set_tag_invalidation_time(Tag(("post", "1")), 4000)
+        )
+        await asyncio.sleep(0)
+
+        await adapter.disconnect()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(caller, 1)
+        assert adapter._invalidations._task is None
+        assert not route.called
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_clear_sends_request(
@@ -148,3 +372,50 @@ class TestAsyncCloudAdapter:
         )
 
         assert route.called
+
+
+class TestClientConfiguration:
+    """Tests for the adapter's HTTP client setup."""
+
+    @pytest.mark.asyncio
+    async def test_honours_proxy_environment(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.test:8080")
+        adapter = AsyncCloudAdapter(api_key="key", base_url="https://api.test.dev")
+
+        assert adapter._client._mounts
+        await adapter.disconnect()
+
+
+class TestInjectedClient:
+    """Tests for adapters using a caller-supplied HTTP client."""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_requests_carry_url_and_headers(self) -> None:
+        """Test that an injected client is sent the adapter's URL and auth."""
+        route = respx.post("https://api.test.dev/v1/cache/delete").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        async with httpx.AsyncClient() as client:
+            adapter = AsyncCloudAdapter(
+                api_key="own-key", base_url="https://api.test.dev/", client=client
+            )
+            await adapter.delete("key1")
+
+        request = route.calls.last.request
+        assert request.headers["Authorization"] == "Bearer own-key"
+        assert request.headers["Content-Type"] == "application/msgpack"
+
+    @pytest.mark.asyncio
+    async def test_disconnect_leaves_injected_client_open(self) -> None:
+        """Test that disconnecting doesn't close a caller's client."""
+        async with httpx.AsyncClient() as client:
+            first = AsyncCloudAdapter(api_key="key", client=client)
+            second = AsyncCloudAdapter(api_key="key", client=client)
+
+            await first.disconnect()
+
+            assert not client.is_closed
+            assert second._client is client
@@ -71,6 +71,29 @@ class TestAsyncMemoryAdapter:
         await async_adapter.set_tag_invalidation_time(tag, 1000)
         assert await async_adapter.get_tag_invalidation_time(tag) == 1000
 
+    @pytest.mark.asyncio
+    async def test_tag_invalidation_times(
+        self, async_adapter: AsyncMemoryAdapter
+    ) -> None:
+        """Test fetching several tag invalidation times at once."""
+        await async_adapter.set_tag_invalidation_time(Tag(("user",)), 1000)
+        await async_adapter.set_tag_invalidation_time(Tag(("user", "123")), 2000)
+
+        times = await async_adapter.get_tag_invalidation_times(
+            [Tag(("user", "123")), Tag(("post",)), Tag(("user",))]
+        )
+        assert times == [2000, None, 1000]
+
+    @pytest.mark.asyncio
+    async def test_set_tag_invalidation_times(
+        self, async_adapter: AsyncMemoryAdapter
+    ) -> None:
+        """Test setting several tag invalidation times at once."""
+        tags = [Tag(("user",)), Tag(("user", "123"))]
+        await async_adapter.set_tag_invalidation_times(tags, 3000)
+
+        assert await async_adapter.get_tag_invalidation_times(tags) == [3000, 3000]
+
     @pytest.mark.asyncio
     async def test_lru_eviction(self) -> None:
         """Test LRU eviction when max_items is set."""
@@ -90,3 +113,46 @@ class TestAsyncMemoryAdapter:
         assert await adapter.get("key1") is None
         assert await adapter.get("key2") is not None
         assert await adapter.get("key3") is not None
+
+    @pytest.mark.asyncio
+    async def test_get_refreshes_lru_position(self) -> None:
+        """Test that reading a key protects it from the next eviction."""
+        adapter = AsyncMemoryAdapter(max_items=2)
+        entry: CacheEntry[object] = CacheEntry(
+            value="test",
+            tags=[],
+            created_at=1000,
+            expires_at=2000,
+            grace_until=None,
+        )
+
+        await adapter.set("key1", entry)
+        await adapter.set("key2", entry)
+        await adapter.get("key1")  # key2 is now least recently used
+        await adapter.set("key3", entry)
+
+        assert await adapter.get("key1") is not None
+        assert await adapter.get("key2") is None
+        assert await adapter.get("key3") is not None
+
+    @pytest.mark.asyncio
+    async def test_eviction_when_all_entries_referenced(self) -> None:
+        """Test that eviction terminates when every entry has been read."""
+        adapter = AsyncMemoryAdapter(max_items=2)
+        entry: CacheEntry[object] = CacheEntry(
+            value="test",
+            tags=[],
+            created_at=1000,
+            expires_at=2000,
+            grace_until=None,
+        )
+
+        await adapter.set("key1", entry)
+        await adapter.set("key2", entry)
+        await adapter.get("key1")
+        await adapter.get("key2")
+        await adapter.set("key3", entry)  # Both get a second chance; key1 goes
+
+        assert await adapter.get("key1") is None
+        assert await adapter.get("key2") is not None
+        assert await adapter.get("key3") is not None
@@ -1,6 +1,7 @@
 """Integration tests for Redis adapter using testcontainers."""
 
 import asyncio
+import json
 
 import pytest
 
@@ -12,7 +13,55 @@ import redis.asyncio
 from testcontainers.redis import RedisContainer
 
 from t87s import CacheEntry, Tag
-from t87s.adapters.redis import AsyncRedisAdapter
+from t87s.adapters.redis import (
+    AsyncRedisAdapter,
+    _deserialize_entry,
+    _serialize_entry,
+)
+
+
+class TestEntrySerialization:
+    """Tests for the Redis wire format (no container needed)."""
+
+    def test_round_trip(self) -> None:
+        """Test that entries survive a serialize/deserialize round trip."""
+        entry: CacheEntry[object] = CacheEntry(
+            value={"id": "456", "blob": b"\x00\xff"},
+            tags=[Tag(("post", "456"))],
+            created_at=2000,
+            expires_at=3000,
+            grace_until=4000,
+        )
+
+        data = _serialize_entry(entry)
+
+        assert isinstance(data, bytes)
+        assert _deserialize_entry(data) == entry
+
+    def test_reads_legacy_json_entries(self) -> None:
+        """Test that entries written as JSON by older versions still load."""
+        legacy = json.dumps(
+            {
+                "value": {"id": "456"},
+                "tags": [["post", "456"]],
+                "created_at": 2000,
+                "expires_at": 3000,
+                "grace_until": None,
+            }
+        ).encode()
+
+        entry = _deserialize_entry(legacy)
+
+        assert entry.value == {"id": "456"}
+        assert entry.tags == [("post", "456")]
+        assert entry.grace_until is None
+
+    def test_rejects_decoding_clients(self) -> None:
+        """Test that clients decoding responses to str fail fast."""
+        client = redis.asyncio.Redis(decode_responses=True)
+
+        with pytest.raises(ValueError, match="decode_responses=False"):
+            AsyncRedisAdapter(client)
 
 
 @pytest.fixture(scope="module")
@@ -91,6 +140,32 @@ class TestAsyncRedisAdapter:
         await async_redis_adapter.set_tag_invalidation_time(tag, 2000)
         assert await async_redis_adapter.get_tag_invalidation_time(tag) == 2000
 
+    @pytest.mark.asyncio
+    async def test_tag_invalidation_times(
+        self, async_redis_adapter: AsyncRedisAdapter
+    ) -> None:
+        """Test fetching several tag invalidation times with one MGET."""
+        await async_redis_adapter.set_tag_invalidation_time(Tag(("post",)), 1000)
+        await async_redis_adapter.set_tag_invalidation_time(Tag(("post", "7")), 2000)
+
+        times = await async_redis_adapter.get_tag_invalidation_times(
+            [Tag(("post", "7")), Tag(("post", "missing")), Tag(("post",))]
+        )
+        assert times == [2000, None, 1000]
+        assert await async_redis_adapter.get_tag_invalidation_times([]) == []
+
+    @pytest.mark.asyncio
+    async def test_set_tag_invalidation_times(
+        self, async_redis_adapter: AsyncRedisAdapter
+    ) -> None:
+        """Test setting several tag invalidation times with one MSET."""
+        tags = [Tag(("post",)), Tag(("post", "7"))]
+        await async_redis_adapter.set_tag_invalidation_times(tags, 3000)
+        await async_redis_adapter.set_tag_invalidation_times([], 4000)
+
+        times = await async_redis_adapter.get_tag_invalidation_times(tags)
+        assert times == [3000, 3000]
+
     @pytest.mark.asyncio
     async def test_clear(self, async_redis_adapter: AsyncRedisAdapter) -> None:
         """Test clearing all cached entries."""
@@ -109,6 +184,26 @@ class TestAsyncRedisAdapter:
         assert await async_redis_adapter.get("async_key1") is None
         assert await async_redis_adapter.get("async_key2") is None
 
+    @pytest.mark.asyncio
+    async def test_clear_many_keys(
+        self, async_redis_adapter: AsyncRedisAdapter
+    ) -> None:
+        """Test clearing more entries than fit in one UNLINK batch."""
+        entry: CacheEntry[object] = CacheEntry(
+            value="test",
+            tags=[],
+            created_at=1000,
+            expires_at=9999999999999,
+            grace_until=None,
+        )
+        for i in range(2500):
+            await async_redis_adapter.set(f"bulk_{i}", entry)
+
+        await async_redis_adapter.clear()
+
+        assert await async_redis_adapter.get("bulk_0") is None
+        assert await async_redis_adapter.get("bulk_2499") is None
+
     @pytest.mark.asyncio
     async def test_ttl_expiration(self, async_redis_adapter: AsyncRedisAdapter) -> None:
         """Test that entries expire based on TTL."""
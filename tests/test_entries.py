@@ -52,3 +52,32 @@ class TestEntriesAccess:
         """Can access value through entries result."""
         result = await cache.get_user("123").entries
         assert result.after.value["name"] == "Test"
+
+    async def test_awaiting_twice_reuses_result(self) -> None:
+        """Awaiting the same query twice runs the lookup once."""
+        calls = 0
+
+        class CountingCache(QueryCache[UserTags]):
+            @cached(UserTags.users())
+            async def get_user(self, user_id: str) -> dict[str, str]:
+                nonlocal calls
+                calls += 1
+                return {"id": user_id}
+
+        cache = CountingCache(adapter=AsyncMemoryAdapter())
+        query = cache.get_user("123")
+
+        assert await query == {"id": "123"}
+        await cache.invalidate(cache.t.users("123"))
+        assert await query == {"id": "123"}
+        assert calls == 1
+
+    async def test_await_after_entries_uses_after_value(
+        self, cache: QueryCache[UserTags]
+    ) -> None:
+        """Awaiting after .entries returns the fetched value."""
+        query = cache.get_user("123")
+        result = await query.entries
+
+        assert await query is result.after.value
+        assert await query.entries is result
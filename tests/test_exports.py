@@ -1,5 +1,10 @@
 """Tests for package exports."""
 
+import subprocess
+import sys
+
+import pytest
+
 
 def test_core_exports_available() -> None:
     """Test that core exports are available."""
@@ -35,3 +40,24 @@ def test_core_exports_available() -> None:
     assert cached is not None
     assert create_primitives is not None
     assert parse_duration is not None
+
+
+def test_optional_adapters_load_lazily() -> None:
+    """Test that optional adapters are only imported on first access."""
+    code = (
+        "import sys, t87s\n"
+        "assert 't87s.adapters.cloud' not in sys.modules\n"
+        "assert 't87s.adapters.redis' not in sys.modules\n"
+        "assert 'msgspec' not in sys.modules\n"
+        "from t87s import AsyncRedisAdapter\n"
+        "assert AsyncRedisAdapter.__module__ == 't87s.adapters.redis'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_unknown_attribute_raises() -> None:
+    """Test that the lazy loader doesn't swallow unknown names."""
+    import t87s
+
+    with pytest.raises(AttributeError):
+        _ = t87s.DoesNotExist  # type: ignore[attr-defined]
@@ -1,10 +1,13 @@
 """Tests for primitives API."""
 
 import asyncio
+import gc
+import weakref
 
 import pytest
 
 from t87s import AsyncMemoryAdapter
+from t87s.adapters.base import AsyncStorageAdapter
 from t87s.primitives import create_primitives
 
 
@@ -69,6 +72,31 @@ class TestQuery:
         assert all(r == {"id": "123"} for r in results)
         assert fetch_count == 1  # Only one fetch despite 5 requests
 
+    async def test_waiters_do_not_block_other_keys(self, primitives) -> None:
+        """Waiting on one in-flight key does not hold up other keys."""
+        release = asyncio.Event()
+
+        async def slow_fn() -> str:
+            await release.wait()
+            return "slow"
+
+        async def fast_fn() -> str:
+            return "fast"
+
+        slow = [
+            asyncio.create_task(primitives.query(key="slow", tags=[], fn=slow_fn))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+
+        fast = await asyncio.wait_for(
+            primitives.query(key="fast", tags=[], fn=fast_fn), timeout=1
+        )
+        assert fast == "fast"
+
+        release.set()
+        assert await asyncio.gather(*slow) == ["slow", "slow"]
+
 
 class TestGetSetDel:
     """Tests for escape hatch operations."""
@@ -186,6 +214,49 @@ class TestTTLAndGrace:
         result3 = await p.query(key="key", tags=[], fn=fetch, ttl="1ms", grace="1s")
         assert result3["count"] == 2
 
+    async def test_expired_entry_skips_tag_lookups(self) -> None:
+        class CountingAdapter(AsyncMemoryAdapter):
+            lookups = 0
+
+            async def get_tag_invalidation_times(self, tags):
+                type(self).lookups += 1
+                return await super().get_tag_invalidation_times(tags)
+
+        p = create_primitives(adapter=CountingAdapter(), default_ttl="1ms")
+
+        async def fetch() -> str:
+            return "value"
+
+        await p.query(key="key", tags=[("users", "1")], fn=fetch)
+        await asyncio.sleep(0.01)
+
+        await p.query(key="key", tags=[("users", "1")], fn=fetch)
+        assert CountingAdapter.lookups == 0
+
+    async def test_grace_hits_share_one_refresh(self) -> None:
+        adapter = AsyncMemoryAdapter()
+        p = create_primitives(adapter=adapter, default_ttl="1ms", default_grace="1s")
+        release = asyncio.Event()
+        fetch_count = 0
+
+        async def fetch() -> int:
+            nonlocal fetch_count
+            fetch_count += 1
+            if fetch_count > 1:
+                await release.wait()
+            return fetch_count
+
+        await p.query(key="key", tags=[], fn=fetch)
+        await asyncio.sleep(0.01)
+
+        for _ in range(5):
+            assert await p.query(key="key", tags=[], fn=fetch) == 1
+            await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert fetch_count == 2
+
 
 class TestClearAndDisconnect:
     """Tests for clear and disconnect."""
@@ -203,6 +274,79 @@ class TestClearAndDisconnect:
         await primitives.disconnect()
         # Should not raise
 
+    async def test_disconnect_stops_background_workers(self) -> None:
+        p = create_primitives(
+            adapter=AsyncMemoryAdapter(), default_ttl="1ms", default_grace="1s"
+        )
+        started = asyncio.Event()
+        fetch_count = 0
+
+        async def fetch() -> int:
+            nonlocal fetch_count
+            fetch_count += 1
+            if fetch_count > 1:
+                started.set()
+                await asyncio.sleep(10)
+            return fetch_count
+
+        await p.query(key="key", tags=[], fn=fetch)
+        await asyncio.sleep(0.01)
+        assert await p.query(key="key", tags=[], fn=fetch) == 1
+        await asyncio.wait_for(started.wait(), timeout=1)
+
+        workers = list(p._workers)
+        await p.disconnect()
+        await asyncio.sleep(0)
+        assert workers
+        assert all(worker.done() for worker in workers)
+
+    async def test_job_queued_while_workers_finish_still_runs(self) -> None:
+        p = create_primitives(adapter=AsyncMemoryAdapter())
+        ran: list[int] = []
+
+        async def job(n: int) -> None:
+            await asyncio.sleep(0)
+            ran.append(n)
+
+        for n in range(16):
+            p._run_in_background(job(n))
+        # Each worker picks up one job and returns on the second step, one
+        # iteration before a done callback could have removed it
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        p._run_in_background(job(16))
+        await asyncio.sleep(0.01)
+
+        assert sorted(ran) == list(range(17))
+        assert not p._workers
+
+    async def test_dropped_without_disconnect_leaves_no_pending_tasks(self) -> None:
+        loop = asyncio.get_running_loop()
+        errors: list[dict] = []
+        previous = loop.get_exception_handler()
+        loop.set_exception_handler(lambda _loop, context: errors.append(context))
+
+        async def fetch() -> str:
+            return "value"
+
+        try:
+            for _ in range(5):
+                p = create_primitives(
+                    adapter=AsyncMemoryAdapter(), default_ttl="1ms", default_grace="1s"
+                )
+                await p.query(key="key", tags=[], fn=fetch)
+                await asyncio.sleep(0.01)
+                await p.query(key="key", tags=[], fn=fetch)
+                await asyncio.sleep(0.01)
+                assert not p._workers
+                del p
+            gc.collect()
+        finally:
+            loop.set_exception_handler(previous)
+
+        assert errors == []
+
 
 class TestOnRefreshCallback:
     """Tests for on_refresh callback during SWR."""
@@ -331,3 +475,130 @@ class TestOnRefreshCallback:
         await asyncio.sleep(0.05)
 
         assert callback_count == 0
+
+
+class TestServerSideTagChecks:
+    """Tests for adapters that check tag invalidation during get()."""
+
+    async def test_skips_tag_lookups_when_adapter_checks_tags(self) -> None:
+        class ServerCheckedAdapter(AsyncMemoryAdapter):
+            checks_tags_on_get = True
+            lookups = 0
+
+            async def get_tag_invalidation_time(self, tag):
+                type(self).lookups += 1
+                return await super().get_tag_invalidation_time(tag)
+
+        adapter = ServerCheckedAdapter()
+        p = create_primitives(adapter=adapter, default_ttl="10s")
+
+        async def fetch() -> str:
+            return "value"
+
+        await p.query(key="k", tags=[("users", "123")], fn=fetch)
+        await p.query(key="k", tags=[("users", "123")], fn=fetch)
+
+        assert ServerCheckedAdapter.lookups == 0
+
+
+class SingleTagAdapter:
+    """Adapter written against the protocol before the batched tag methods."""
+
+    def __init__(self) -> None:
+        self._inner = AsyncMemoryAdapter()
+
+    async def get(self, key):
+        return await self._inner.get(key)
+
+    async def set(self, key, entry):
+        await self._inner.set(key, entry)
+
+    async def delete(self, key):
+        await self._inner.delete(key)
+
+    async def get_tag_invalidation_time(self, tag):
+        return await self._inner.get_tag_invalidation_time(tag)
+
+    async def set_tag_invalidation_time(self, tag, timestamp):
+        await self._inner.set_tag_invalidation_time(tag, timestamp)
+
+    async def clear(self):
+        await self._inner.clear()
+
+    async def disconnect(self):
+        await self._inner.disconnect()
+
+
+class TestSingleTagAdapters:
+    """Tests for adapters without the batched tag methods."""
+
+    async def test_hits_fall_back_to_single_tag_lookups(self) -> None:
+        adapter = SingleTagAdapter()
+        p = create_primitives(adapter=adapter, default_ttl="10s")
+        fetch_count = 0
+
+        async def fetch() -> int:
+            nonlocal fetch_count
+            fetch_count += 1
+            return fetch_count
+
+        assert await p.query(key="k", tags=[("users", "1")], fn=fetch) == 1
+        assert await p.query(key="k", tags=[("users", "1")], fn=fetch) == 1
+
+        # Invalidate the parent tag at a time after the entry was created
+        await adapter.set_tag_invalidation_time(("users",), 2**62)
+        assert await p.query(key="k", tags=[("users", "1")], fn=fetch) == 2
+
+    async def test_fallbacks_leave_no_reference_cycle(self) -> None:
+        p = create_primitives(adapter=SingleTagAdapter())
+        ref = weakref.ref(p)
+
+        gc.disable()
+        try:
+            del p
+            assert ref() is None
+        finally:
+            gc.enable()
+
+    async def test_invalidate_falls_back_to_single_tag_writes(self) -> None:
+        adapter = SingleTagAdapter()
+        p = create_primitives(adapter=adapter, default_ttl="10s")
+        fetch_count = 0
+
+        async def fetch() -> int:
+            nonlocal fetch_count
+            fetch_count += 1
+            return fetch_count
+
+        assert isinstance(adapter, AsyncStorageAdapter)
+        await p.query(key="k", tags=[("users", "1")], fn=fetch)
+        await asyncio.sleep(0.002)
+        await p.invalidate([("users", "1"), ("posts", "1")])
+
+        assert await p.query(key="k", tags=[("users", "1")], fn=fetch) == 2
+        assert await adapter.get_tag_invalidation_time(("posts", "1")) is not None
+
+
+class TestVerification:
+    """Tests for reporting verification results to the adapter."""
+
+    async def test_reports_to_verifiable_adapters(self) -> None:
+        reports: list[bool] = []
+
+        class VerifiableAdapter(AsyncMemoryAdapter):
+            async def report_verification(
+                self, key: str, is_stale: bool, cached_hash: str, fresh_hash: str
+            ) -> None:
+                reports.append(is_stale)
+
+        p = create_primitives(adapter=VerifiableAdapter(), verify_percent=1.0)
+        plain = create_primitives(adapter=AsyncMemoryAdapter(), verify_percent=1.0)
+        assert plain._verifier is None
+
+        async def fetch() -> str:
+            return "value"
+
+        await p.query(key="k", tags=[], fn=fetch)
+        await p.query(key="k", tags=[], fn=fetch)
+        await asyncio.sleep(0.01)
+        assert reports == [False]
@@ -1,5 +1,10 @@
 """Tests for QueryCache with @cached decorator."""
 
+import asyncio
+import copy
+import functools
+import gc
+import weakref
 from dataclasses import dataclass
 from typing import Any
 
@@ -67,6 +72,52 @@ class TestQueryCacheBasics:
         await cache.get_user("123")
         assert fetch_count == 1
 
+    async def test_cache_key_format(self) -> None:
+        """Entries are stored under "name:args:kwargs"."""
+
+        class MyCache(QueryCache[TestTags]):
+            @cached(TestTags.users())
+            async def get_user(self, id: str) -> User:
+                return User(id=id, name=f"User {id}")
+
+        cache = MyCache(adapter=AsyncMemoryAdapter())
+        await cache.get_user("123")
+
+        assert await cache.primitives.get("get_user:('123',):{}") == User(
+            id="123", name="User 123"
+        )
+
+    async def test_bound_query_holds_no_cycle(self) -> None:
+        """Accessing a query doesn't keep a dropped cache alive."""
+
+        class MyCache(QueryCache[TestTags]):
+            @cached(TestTags.users())
+            async def get_user(self, id: str) -> User:
+                return User(id=id, name=f"User {id}")
+
+        cache = MyCache(adapter=AsyncMemoryAdapter())
+        assert await cache.get_user("1") == User(id="1", name="User 1")
+        ref = weakref.ref(cache)
+
+        gc.disable()
+        try:
+            del cache
+            assert ref() is None
+        finally:
+            gc.enable()
+
+    async def test_copied_cache_binds_its_own_queries(self) -> None:
+        class MyCache(QueryCache[TestTags]):
+            @cached(TestTags.users())
+            async def get_user(self, id: str) -> User:
+                return User(id=id, name=f"User {id}")
+
+        cache = MyCache(adapter=AsyncMemoryAdapter())
+        await cache.get_user("1")
+        clone = copy.copy(cache)
+
+        assert clone.get_user._cache is clone
+
     async def test_wild_count_validation(self) -> None:
         """Methods must have same param count as wilds."""
         with pytest.raises(TypeError, match="wilds"):
@@ -76,6 +127,34 @@ class TestQueryCacheBasics:
                 async def get_user(self) -> User:  # 0 params
                     return User("", "")
 
+    async def test_wild_count_validation_counts_keyword_only_params(self) -> None:
+        """Keyword-only params count toward the param total."""
+        with pytest.raises(TypeError, match="2 params"):
+
+            class BadCache(QueryCache[TestTags]):
+                @cached(TestTags.users())  # 1 wild
+                async def get_user(self, id: str, *, full: bool) -> User:
+                    return User(id, "")
+
+    async def test_wild_count_validation_sees_through_wraps(self) -> None:
+        """Params of a functools.wraps-decorated method are counted."""
+
+        def logged(fn: Any) -> Any:
+            @functools.wraps(fn)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await fn(*args, **kwargs)
+
+            return wrapper
+
+        class MyCache(QueryCache[TestTags]):
+            @cached(TestTags.users())
+            @logged
+            async def get_user(self, id: str) -> User:
+                return User(id=id, name=f"User {id}")
+
+        cache = MyCache(adapter=AsyncMemoryAdapter())
+        assert await cache.get_user("1") == User(id="1", name="User 1")
+
 
 class TestQueryCacheTags:
     """Test tag construction and invalidation."""
@@ -87,6 +166,16 @@ class TestQueryCacheTags:
         cache = MyCache(adapter=AsyncMemoryAdapter())
         assert isinstance(cache.t, TestTags)
 
+    async def test_subclass_inherits_schema(self) -> None:
+        class BaseCache(QueryCache[TestTags]):
+            pass
+
+        class MyCache(BaseCache):
+            pass
+
+        cache = MyCache(adapter=AsyncMemoryAdapter())
+        assert isinstance(cache.t, TestTags)
+
     async def test_invalidate_with_typed_tag(self) -> None:
         fetch_count = 0
 
@@ -136,6 +225,75 @@ class TestQueryCacheTags:
         assert post_fetch_count == 2
         assert comment_fetch_count == 2
 
+    async def test_batch_invalidation_sends_one_batch(self) -> None:
+        class MyCache(QueryCache[TestTags]):
+            pass
+
+        calls: list[list[tuple[str, ...]]] = []
+        cache = MyCache(adapter=AsyncMemoryAdapter())
+        invalidate = cache.primitives.invalidate
+
+        async def recording_invalidate(tags: list[tuple[str, ...]]) -> None:
+            calls.append(tags)
+            await invalidate(tags)
+
+        cache.primitives.invalidate = recording_invalidate  # type: ignore[method-assign]
+
+        async with cache.batch_invalidation():
+            await cache.invalidate(cache.t.users("1"))
+            async with cache.batch_invalidation():
+                await cache.invalidate(cache.t.users("1"), cache.t.posts("p1"))
+            assert calls == []
+
+        assert calls == [[("users", "1"), ("posts", "p1")]]
+
+    async def test_batch_invalidation_flushes_on_error(self) -> None:
+        fetch_count = 0
+
+        class MyCache(QueryCache[TestTags]):
+            @cached(TestTags.users())
+            async def get_user(self, id: str) -> User:
+                nonlocal fetch_count
+                fetch_count += 1
+                return User(id=id, name=f"User {id}")
+
+        cache = MyCache(adapter=AsyncMemoryAdapter())
+        await cache.get_user("123")
+
+        with pytest.raises(RuntimeError):
+            async with cache.batch_invalidation():
+                await cache.invalidate(cache.t.users("123"))
+                raise RuntimeError("write failed")
+
+        await cache.get_user("123")
+        assert fetch_count == 2
+
+    async def test_batch_invalidation_sends_late_task_invalidations(self) -> None:
+        fetch_count = 0
+
+        class MyCache(QueryCache[TestTags]):
+            @cached(TestTags.users())
+            async def get_user(self, id: str) -> int:
+                nonlocal fetch_count
+                fetch_count += 1
+                return fetch_count
+
+        cache = MyCache(adapter=AsyncMemoryAdapter())
+        assert await cache.get_user("123") == 1
+        await asyncio.sleep(0.002)
+        release = asyncio.Event()
+
+        async def invalidate_later() -> None:
+            await release.wait()
+            await cache.invalidate(cache.t.users("123"))
+
+        async with cache.batch_invalidation():
+            task = asyncio.create_task(invalidate_later())
+
+        release.set()
+        await task
+        assert await cache.get_user("123") == 2
+
 
 class TestQueryCachePrimitives:
     """Test primitives escape hatch."""
@@ -1,6 +1,9 @@
 """Tests for TagSchema, Wild, Static system."""
 
-from t87s.schema import Static, TagSchema, Wild
+import gc
+import weakref
+
+from t87s.schema import _HINTS_ATTR, Static, TagSchema, Wild
 from t87s.typed_tag import TypedTag
 
 
@@ -47,6 +50,45 @@ class TestSchemaClassAccess:
         assert spec.segments == ("config",)
         assert spec.wild_count == 0
 
+    def test_class_access_reuses_spec(self) -> None:
+        assert RootTags.posts is RootTags.posts
+        assert RootTags.config is RootTags.config
+        assert RootTags.posts().segments == ("posts", "*")
+
+    def test_only_wild_and_static_annotations_become_segments(self) -> None:
+        class Wildcard:
+            pass
+
+        class MixedTags(TagSchema):
+            later: "Wild[NotYetDefined]"  # noqa: F821
+            flag: "Static"
+            other: Wildcard
+
+        assert MixedTags.later().segments == ("later", "*")
+        assert MixedTags.flag.segments == ("flag",)
+        assert "other" not in MixedTags.__dict__
+
+    def test_resolved_hints_are_freed_with_the_class(self) -> None:
+        class ForwardTags(TagSchema):
+            posts: "Wild[PostChildren]"
+
+        assert ForwardTags.posts().comments.segments == ("posts", "*", "comments")
+        assert _HINTS_ATTR in ForwardTags.__dict__
+        ref = weakref.ref(ForwardTags)
+
+        del ForwardTags
+        gc.collect()
+        assert ref() is None
+
+    def test_static_string_annotations_skip_hint_resolution(self) -> None:
+        class LeafTags(TagSchema):
+            config: "Static"
+            flags: "t87s.Static"  # noqa: F821
+
+        assert LeafTags.config.segments == ("config",)
+        assert LeafTags.flags.segments == ("flags",)
+        assert _HINTS_ATTR not in LeafTags.__dict__
+
 
 class TestSchemaInstanceAccess:
     """Test instance-level access (for runtime tag construction)."""
@@ -72,6 +114,13 @@ class TestSchemaInstanceAccess:
         assert isinstance(tag, TypedTag)
         assert tag.path == ("config",)
 
+    def test_root_segments_are_shared(self) -> None:
+        """Root-level nodes and tags are reused; nested ones are built fresh."""
+        assert RootTags().posts is RootTags().posts
+        assert RootTags().config is RootTags().config
+        assert RootTags().posts("1").settings.path == ("posts", "1", "settings")
+        assert RootTags().posts("2").settings.path == ("posts", "2", "settings")
+
 
 class TestBuildPath:
     """Test building paths from specs."""
@@ -90,3 +139,9 @@ class TestBuildPath:
         spec = RootTags.config
         path = spec.build_path(())
         assert path == ("config",)
+
+    def test_build_path_ignores_extra_args(self) -> None:
+        spec = RootTags.posts()
+        path = spec.build_path(("p1", "c1"))
+        assert path == ("posts", "p1")
+        assert RootTags.config.build_path(("p1",)) == ("config",)